@@ -5,14 +5,30 @@ import base64
 import logging
 import os
 import platform
+import re
+import secrets
 import shutil
 import subprocess
 import sys
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from shutil import move, unpack_archive, which
 from typing import Dict, List
 
+# Resolved once; falls back to a PATH lookup at exec time if docker is installed later
+DOCKER_BIN = which("docker") or "docker"
+
+# KEY=value lines of a .env file, allowing an `export ` prefix and blanks around `=`;
+# comments and blank lines never match
+ENV_LINE_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([^#=\s][^=\s]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+# Parsed .env files keyed by (absolute path, mtime_ns), so edits invalidate entries
+ENV_CACHE: Dict[tuple, Dict[str, str]] = {}
+ENV_CACHE_SIZE = 32
+
 logging.basicConfig(
     filename="easy-install.log",
     filemode="w",
@@ -62,14 +78,15 @@ def clone_frappe_docker_repo() -> None:
 
 
 def get_from_env(dir, file) -> Dict:
-    env_vars = {}
-    with open(os.path.join(dir, file)) as f:
-        for line in f:
-            if line.startswith("#") or not line.strip():
-                continue
-            key, value = line.strip().split("=", 1)
-            env_vars[key] = value
-    return env_vars
+    path = os.path.abspath(os.path.join(dir, file))
+    key = (path, os.stat(path).st_mtime_ns)
+    if key not in ENV_CACHE:
+        with open(path) as f:
+            ENV_CACHE[key] = dict(ENV_LINE_RE.findall(f.read()))
+        if len(ENV_CACHE) > ENV_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del ENV_CACHE[next(iter(ENV_CACHE))]
+    return dict(ENV_CACHE[key])
 
 
 def write_to_env(
@@ -88,44 +105,42 @@ def write_to_env(
     quoted_sites = ",".join([f"`{site}`" for site in sites]).strip(",")
     example_env = get_from_env(frappe_docker_dir, "example.env")
     erpnext_version = erpnext_version or example_env["ERPNEXT_VERSION"]
-    env_file_lines = [
-        # defaults to latest version of ERPNext
-        f"ERPNEXT_VERSION={erpnext_version}\n",
-        f"DB_PASSWORD={db_pass}\n",
-        "DB_HOST=db\n",
-        "DB_PORT=3306\n",
-        "REDIS_CACHE=redis-cache:6379\n",
-        "REDIS_QUEUE=redis-queue:6379\n",
-        "REDIS_SOCKETIO=redis-socketio:6379\n",
-        f"LETSENCRYPT_EMAIL={email}\n",
-        f"SITE_ADMIN_PASS={admin_pass}\n",
-        f"SITES={quoted_sites}\n",
-        "PULL_POLICY=missing\n",
-        f'BACKUP_CRONSTRING="{cronstring}"\n',
-    ]
+    # ERPNEXT_VERSION defaults to latest version of ERPNext
+    env_file_contents = (
+        f"ERPNEXT_VERSION={erpnext_version}\n"
+        f"DB_PASSWORD={db_pass}\n"
+        "DB_HOST=db\n"
+        "DB_PORT=3306\n"
+        "REDIS_CACHE=redis-cache:6379\n"
+        "REDIS_QUEUE=redis-queue:6379\n"
+        "REDIS_SOCKETIO=redis-socketio:6379\n"
+        f"LETSENCRYPT_EMAIL={email}\n"
+        f"SITE_ADMIN_PASS={admin_pass}\n"
+        f"SITES={quoted_sites}\n"
+        "PULL_POLICY=missing\n"
+        f'BACKUP_CRONSTRING="{cronstring}"\n'
+    )
 
     if http_port:
-        env_file_lines.append(f"HTTP_PUBLISH_PORT={http_port}\n")
+        env_file_contents += f"HTTP_PUBLISH_PORT={http_port}\n"
 
     if custom_image:
-        env_file_lines.append(f"CUSTOM_IMAGE={custom_image}\n")
+        env_file_contents += f"CUSTOM_IMAGE={custom_image}\n"
 
     if custom_tag:
-        env_file_lines.append(f"CUSTOM_TAG={custom_tag}\n")
+        env_file_contents += f"CUSTOM_TAG={custom_tag}\n"
 
     with open(os.path.join(out_file), "w") as f:
-        f.writelines(env_file_lines)
+        f.write(env_file_contents)
 
 
 def generate_pass(length: int = 12) -> str:
-    """Generate random hash using best available randomness source."""
-    import math
-    import secrets
-
+    """Generate random password using best available randomness source."""
     if not length:
         length = 56
 
-    return secrets.token_hex(math.ceil(length / 2))[:length]
+    # token_urlsafe(n) yields ~1.3 chars per byte, so n bytes always cover `length` chars
+    return secrets.token_urlsafe(length)[:length]
 
 
 def get_frappe_docker_path():
@@ -386,6 +401,17 @@ def setup_dev_instance(project: str):
         cprint("Setting Up Development Environment Failed\n", e)
 
 
+def wait_for_docker(timeout: float = 30, interval: float = 0.2) -> bool:
+    """Poll systemd until the docker service is active, up to `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ps = subprocess.run(["systemctl", "is-active", "--quiet", "docker"])
+        if ps.returncode == 0:
+            return True
+        time.sleep(interval)
+    return False
+
+
 def install_docker():
     cprint("Docker is not installed, Installing Docker...", level=3)
     logging.info("Docker not found, installing Docker")
@@ -399,12 +425,9 @@ def install_docker():
         logging.debug("Docker setup failed due to platform is not Linux")
         sys.exit(1)
     try:
-        ps = subprocess.run(
-            ["curl", "-fsSL", "https://get.docker.com"],
-            capture_output=True,
-            check=True,
-        )
-        subprocess.run(["/bin/bash"], input=ps.stdout, capture_output=True)
+        with urllib.request.urlopen("https://get.docker.com", timeout=30) as response:
+            script = response.read()
+        subprocess.run(["/bin/bash", "-s"], input=script, capture_output=True, check=True)
         subprocess.run(
             [
                 "sudo",
@@ -416,16 +439,16 @@ def install_docker():
             check=True,
         )
         cprint("Waiting Docker to start", level=3)
-        time.sleep(10)
-        subprocess.run(
-            [
-                "sudo",
-                "systemctl",
-                "restart",
-                "docker.service",
-            ],
-            check=True,
-        )
+        if not wait_for_docker():
+            subprocess.run(
+                [
+                    "sudo",
+                    "systemctl",
+                    "restart",
+                    "docker.service",
+                ],
+                check=True,
+            )
     except Exception as e:
         logging.error("Installing Docker failed", exc_info=True)
         cprint("Failed to Install Docker\n", e)
@@ -674,6 +697,17 @@ def add_exec_parser(subparsers: argparse.ArgumentParser):
     parser = add_project_option(parser)
 
 
+def push_image(tag: str) -> str:
+    ps = subprocess.run(
+        [DOCKER_BIN, "push", tag],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        check=True,
+    )
+    return ps.stdout
+
+
 def build_image(
     push: bool,
     frappe_path: str,
@@ -691,19 +725,16 @@ def build_image(
     if not tags:
         tags = ["custom-apps:latest"]
 
-    apps_json_base64 = None
     try:
         with open(apps_json_path, "rb") as file_text:
-            file_read = file_text.read()
-            apps_json_base64 = (
-                base64.encodebytes(file_read).decode("utf-8").replace("\n", "")
-            )
-    except Exception as e:
+            apps_json_base64 = base64.b64encode(file_text.read()).decode("ascii")
+    except OSError as e:
         logging.error("Unable to base64 encode apps.json", exc_info=True)
         cprint("\nUnable to base64 encode apps.json\n\n", "[ERROR]: ", e, level=1)
+        sys.exit(1)
 
     command = [
-        which("docker"),
+        DOCKER_BIN,
         "build",
         "--progress=plain",
     ]
@@ -733,11 +764,24 @@ def build_image(
 
     if push:
         try:
-            for tag in tags:
-                subprocess.run(
-                    [which("docker"), "push", tag],
-                    check=True,
-                )
+            # Tags share layers, so after the first upload the rest are mostly
+            # manifest pushes; run them concurrently instead of one by one.
+            # Every tag's output is printed, failures included, before the first
+            # failure is re-raised, so docker's own error message is never lost.
+            failed = None
+            with ThreadPoolExecutor(max_workers=min(4, len(tags))) as executor:
+                futures = {executor.submit(push_image, tag): tag for tag in tags}
+                for future in as_completed(futures):
+                    tag = futures[future]
+                    try:
+                        output = future.result()
+                    except subprocess.CalledProcessError as e:
+                        output = e.output or ""
+                        failed = failed or e
+                    for line in output.splitlines():
+                        print(f"[{tag}] {line}")
+            if failed:
+                raise failed
         except Exception as e:
             logging.error("Image push failed", exc_info=True)
             cprint("\nImage push failed\n\n", "[ERROR]: ", e, level=1)
@@ -1,4 +1,20 @@
+import compileall
+import os
+
 from setuptools import setup, find_packages
+from setuptools.command.install import install
+
+
+class CompileAllInstall(install):
+    """Byte-compile the installed package so the first `vma` run doesn't pay for it."""
+
+    def run(self):
+        super().run()
+        # A set root means a staged install (bdist_wheel, packaging); the .pyc files would be
+        # interpreter-specific and the final installer (pip) byte-compiles anyway
+        if self.root is None:
+            compileall.compile_dir(os.path.join(self.install_lib, "vma"), quiet=1, workers=0)
+
 
 setup(
     name="vma",
@@ -21,4 +37,5 @@ setup(
             "vma=vma.cli:cli",
         ],
     },
+    cmdclass={"install": CompileAllInstall},
 )
@@ -0,0 +1,29 @@
+import click
+from pathlib import Path
+
+@click.command()
+@click.argument("repo_url")
+@click.option("--tenant", required=True, help="Tenant name")
+@click.option("--branch", required=True, help="Git branch to clone")
+def deploy(repo_url, tenant, branch):
+    """Deploy an app from a git repository."""
+    from vma.core.plugins import get_plugin_for_path
+    from vma.utils import git_clone, log
+    tenant_dir = Path("tenants") / tenant
+    tenant_dir.mkdir(parents=True, exist_ok=True)
+    app_name = repo_url.rstrip("/").split("/")[-1].replace(".git", "")
+    app_path = tenant_dir / app_name
+    if app_path.exists():
+        log(f"App {app_name} already exists for tenant {tenant}", level=1)
+        return
+    log(f"Cloning {repo_url} (branch {branch}) to {app_path}")
+    git_clone(repo_url, branch, app_path)
+    plugin = get_plugin_for_path(str(app_path))
+    if not plugin:
+        log("No suitable plugin found for this app type.", level=1)
+        return
+    log(f"Detected app type: {plugin.__name__}")
+    plugin.install(str(app_path), {})
+    plugin.build(str(app_path), {})
+    plugin.start(str(app_path), {})
+    log(f"App {app_name} deployed for tenant {tenant}")
@@ -0,0 +1,109 @@
+import click
+from pathlib import Path
+
+@click.command()
+@click.option("--tenant", required=True, help="Tenant name")
+@click.option("--backend-repo-url", required=True, help="Git URL of the backend repository")
+@click.option("--backend-branch", required=True, help="Git branch of the backend repository")
+def deploy_backend(tenant, backend_repo_url, backend_branch):
+    """
+    Deploy the backend application for a tenant.
+    Generates config, creates infrastructure (DB, Redis), clones backend repo,
+    generates compose file, writes backend .env, starts infrastructure and backend,
+    adds to /etc/hosts, and runs backend health checks.
+    """
+    import subprocess
+    from vma.utils import (
+        generate_tenant_config,
+        clone_project_repo,
+        generate_base_compose_file,
+        write_env_file,
+        random_string,
+        run,
+        wait_for_service,
+        add_tenant_to_hosts,
+    )
+
+    print(f"Deploying backend for tenant {tenant}...")
+
+    # Ensure tenant directory exists
+    tenant_dir = Path(f"tenants/{tenant}")
+    tenant_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Ensured tenant directory exists: {tenant_dir}")
+
+    # Generate tenant config (will reuse existing if tenant dir exists)
+    config = generate_tenant_config(tenant)
+    print(f"Generated tenant config: {config}")
+
+    # Clone the backend repo into a 'backend' subfolder
+    backend_project_path = clone_project_repo(backend_repo_url, backend_branch, Path(f"tenants/{tenant}/backend"))
+    print(f"Cloned backend repo to: {backend_project_path}")
+
+    # Generate base compose file including infra and backend
+    compose_path = generate_base_compose_file(tenant, config, backend_project_path)
+    print(f"Generated base compose file at: {compose_path}")
+
+    # 6. Write backend .env (using write_env_file directly)
+    backend_env = {
+        "PORT": "5004", # Fixed based on application logs
+        # SMTP related keys omitted as they cannot be auto-generated/handled securely
+        "EMAIL": f"no-reply@{tenant}.vsync", # Use tenant-specific email format
+        # PASSWORD and SERVICE omitted
+        "SESSION_SECRET": random_string(32), # Auto-generated
+        "SESSION_COOKIE_NAME": "vmaTechLabs", # Fixed value from user
+        "SESSION_MAX_AGE": "3600000", # Fixed value from user
+        "REDIS_URL": f"redis://:{config['redis_pass']}@{tenant}_redis:6379", # Use tenant-specific Redis URL
+        "DB_PORT": "5432", # Fixed value from user
+        "DB_POOL_MIN": "0", # Fixed value from user
+        "DB_POOL_MAX": "100", # Fixed value from user
+        "DB_USERNAME": config["db_user"], # Generated tenant user
+        "DB_SERVER": f"{tenant}_db", # Use tenant-specific DB container name
+        "DB_PASSWORD": config["db_pass"], # Generated tenant password
+        "DB_DATABASE_MASTER": config["db_master_name"], # Generated tenant master database name
+        "DB_DATABASE_TRANSACTIONAL": config["db_transactional_name"], # Generated tenant transactional database name
+        "CONFIRM_DELETION": "true", # Fixed value from user
+        "NODE_ENV": "development", # Add NODE_ENV
+        "NODE_ENV_DEV": "development", # Fixed value from user
+        "NODE_ENV_DEV2": "developmentDB2",
+        "NODE_ENV_TRIGGER": "trigger"
+    }
+    write_env_file(str(backend_project_path / ".env"), backend_env)
+    print(f"Written backend .env to {backend_project_path / '.env'}")
+
+    # Add to /etc/hosts before starting containers, so the entry exists even if a
+    # healthcheck wait below fails
+    add_tenant_to_hosts(tenant, config=config)
+
+    # The DB container's initdb script creates the transactional database on a fresh volume
+    # (also when the stack is started with plain `docker compose up`), but it only runs on an
+    # empty data volume, so a volume from an earlier deploy may still lack it. Bring the DB
+    # up first and create the database if it is missing before the backend starts using it.
+    print(f"Starting database container for tenant {tenant}...")
+    run(f"docker compose -f {compose_path.name} up -d --wait --wait-timeout 60 {tenant}_db", cwd=str(compose_path.parent))
+    psql = ["docker", "exec", f"{tenant}_db", "psql", "-U", config["db_user"], "-d", config["db_master_name"]]
+    # Only stdout is compared; run() merges stderr, where psql notices and warnings would land
+    probe = subprocess.run(
+        psql + ["-tAc", f"SELECT 1 FROM pg_database WHERE datname = '{config['db_transactional_name']}'"],
+        capture_output=True, text=True
+    )
+    if probe.stdout.strip() != "1":
+        print(f"Creating missing database {config['db_transactional_name']}...")
+        subprocess.run(
+            psql + ["-c", f"CREATE DATABASE {config['db_transactional_name']} OWNER {config['db_user']};"],
+            check=True
+        )
+
+    # Bring up infrastructure and backend in one compose invocation; `up -d` is idempotent so
+    # no prior stop is needed, and the backend waits on the DB healthcheck via depends_on.
+    # --wait blocks until every service's healthcheck passes, so no HTTP polling is needed.
+    print(f"Starting infrastructure and backend containers for tenant {tenant}...")
+    try:
+        run(f"docker compose -f {compose_path.name} up -d --wait --wait-timeout 300 {tenant}_db {tenant}_redis {tenant}_backend", cwd=str(compose_path.parent))
+    except subprocess.CalledProcessError:
+        # Probe the backend directly to help diagnose why the healthcheck failed
+        print("Backend did not become healthy, probing it directly...")
+        wait_for_service(f"http://localhost:{config['backend_port']}/v1/api", timeout=5)
+        raise
+    print("Backend health checks completed.")
+
+    print(f"Backend deployment for tenant {tenant} completed.")
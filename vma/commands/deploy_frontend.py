@@ -0,0 +1,83 @@
+import click
+from pathlib import Path
+
+@click.command()
+@click.option("--tenant", required=True, help="Tenant name")
+@click.option("--frontend-repo-url", required=True, help="Git URL of the frontend repository")
+@click.option("--frontend-branch", required=True, help="Git branch of the frontend repository")
+def deploy_frontend(tenant, frontend_repo_url, frontend_branch):
+    """
+    Deploy the frontend application for a tenant.
+    Clones frontend repo, updates compose file, writes frontend .env,
+    starts frontend container, generates Nginx config, and runs frontend health checks.
+    Assumes infrastructure and backend are already deployed via deploy-backend.
+    """
+    import subprocess
+    from vma.utils import (
+        generate_tenant_config,
+        clone_project_repo,
+        add_frontend_to_compose_file,
+        write_env_file,
+        run,
+        wait_for_service,
+    )
+
+    print(f"Deploying frontend for tenant {tenant}...")
+
+    # Ensure tenant directory exists and compose file exists
+    tenant_dir = Path(f"tenants/{tenant}")
+    if not tenant_dir.exists():
+        print(f"Tenant directory {tenant_dir} does not exist. Please run deploy-backend first.")
+        return
+
+    compose_path = tenant_dir / "docker-compose.yml"
+    if not compose_path.exists():
+        print(f"docker-compose.yml not found at {compose_path}. Please run deploy-backend first.")
+        return
+
+    # Generate tenant config (to get ports, etc.)
+    config = generate_tenant_config(tenant)
+
+    # Clone the frontend repo into a 'frontend' subfolder
+    frontend_project_path = clone_project_repo(frontend_repo_url, frontend_branch, Path(f"tenants/{tenant}/frontend"))
+    print(f"Cloned frontend repo to: {frontend_project_path}")
+
+    # Update compose file to include frontend service
+    add_frontend_to_compose_file(tenant, config, frontend_project_path, compose_path)
+    print(f"Updated compose file at: {compose_path}")
+
+    # Write frontend .env with the correct API URL using the domain name
+    nginx_port = config["nginx_port"]
+    backend_port = config["backend_port"]
+    frontend_env = {
+        "BASE_URL": f"http://{tenant}.vsync:{nginx_port}/v1/api",
+        "REACT_APP_BASE_URL": f"http://{tenant}.vsync:{nginx_port}/v1/api"  # Include both variable names for compatibility
+    }
+    write_env_file(str(frontend_project_path / ".env"), frontend_env)
+    print(f"Written frontend .env to {frontend_project_path / '.env'} with API URL: {frontend_env['BASE_URL']}")
+
+    # Start frontend and nginx together; --wait blocks until their healthchecks pass
+    print(f"Starting frontend and nginx containers...")
+    try:
+        run(f"docker compose -f {compose_path.name} up -d --wait --wait-timeout 300 {tenant}_frontend {tenant}_nginx", cwd=str(compose_path.parent))
+    except subprocess.CalledProcessError:
+        # Probe each hop directly to help diagnose why the healthchecks failed
+        print("Frontend did not become healthy, checking container status...")
+        run(f"docker ps | grep {tenant}", cwd=str(compose_path.parent), _raise=False)
+        wait_for_service(f"http://localhost:{backend_port}/v1/api", timeout=5)
+        wait_for_service(f"http://{tenant}.vsync:{nginx_port}/", timeout=5)
+        wait_for_service(f"http://{tenant}.vsync:{nginx_port}/v1/api", timeout=5)
+        raise
+    print(f"Frontend and nginx containers started.")
+
+    print("Health checks completed.")
+
+    # Print access information with multiple options
+    print(f"\nAccess your application at:")
+    print(f"Frontend via domain: http://{tenant}.vsync:{nginx_port}/")
+    print(f"Frontend via localhost: http://localhost:{nginx_port}/")
+    print(f"API via domain: http://{tenant}.vsync:{nginx_port}/v1/api")
+    print(f"API via localhost: http://localhost:{nginx_port}/v1/api")
+    print(f"Direct backend API: http://localhost:{backend_port}/v1/api")
+
+    print(f"Frontend deployment for tenant {tenant} completed.")
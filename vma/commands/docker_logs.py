@@ -1,5 +1,5 @@
 import click
-from vma.utils import run
+from vma.utils import run, fetch_container_logs
 
 @click.command()
 @click.option("--tenant", required=True, help="Tenant name")
@@ -11,9 +11,8 @@ def docker_logs(tenant, app):
         run(f"docker logs {tenant}_{app}", _raise=False)
     else:
         print(f"Showing logs for all {tenant} containers")
-        print(f"\n--- FRONTEND LOGS ---")
-        run(f"docker logs {tenant}_frontend 2>&1 | tail -n 20", _raise=False)
-        print(f"\n--- BACKEND LOGS ---")
-        run(f"docker logs {tenant}_backend 2>&1 | tail -n 20", _raise=False)
-        print(f"\n--- NGINX LOGS ---")
-        run(f"docker logs {tenant}_nginx 2>&1 | tail -n 20", _raise=False)
\ No newline at end of file
+        services = ("frontend", "backend", "nginx")
+        outputs = fetch_container_logs([f"{tenant}_{service}" for service in services])
+        for service, output in zip(services, outputs):
+            print(f"\n--- {service.upper()} LOGS ---")
+            print(output)
\ No newline at end of file
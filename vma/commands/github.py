@@ -1,17 +1,72 @@
 import click
+import json
+import os
+from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+CACHE_DIR = Path.home() / ".cache" / "vma" / "github"
+
+# Shared keep-alive session so paginated fetches reuse one TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    # raise_on_status=False hands the last 5xx back to the status handling below
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+))
+REQUEST_TIMEOUT = (3, 10)
+PER_PAGE = 100
+
+def _read_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
 
 @click.command()
 @click.argument("username")
 def list_github_repos(username):
     """List all public repositories for a GitHub user."""
     url = f"https://api.github.com/users/{username}/repos"
-    response = requests.get(url)
-    
-    if response.status_code == 200:
+    cache_path = CACHE_DIR / f"{username}.json"
+    cached = _read_cache(cache_path)
+
+    headers = {"Accept": "application/vnd.github+json"}
+    # The ETag only covers the first page, so a 304 proves the listing unchanged (at no
+    # rate-limit cost) only when the cached listing fit on that single page
+    if cached and cached.get("etag") and len(cached.get("repos", [])) < PER_PAGE:
+        headers["If-None-Match"] = cached["etag"]
+
+    response = _SESSION.get(url, params={"per_page": PER_PAGE}, headers=headers, timeout=REQUEST_TIMEOUT)
+
+    if response.status_code == 304:
+        repos = cached["repos"]
+    elif response.status_code == 200:
+        etag = response.headers.get("ETag")
         repos = response.json()
-        click.echo(f"Found {len(repos)} repositories for {username}:")
-        for repo in repos:
-            click.echo(f"- {repo['name']}: {repo['html_url']}")
+        while "next" in response.links:
+            response = _SESSION.get(response.links["next"]["url"], headers={"Accept": headers["Accept"]},
+                                    timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                click.echo(f"Error: {response.status_code} - {response.text}")
+                return
+            repos.extend(response.json())
+        repos = [{"name": repo["name"], "html_url": repo["html_url"]} for repo in repos]
+        _write_cache(cache_path, {"etag": etag, "repos": repos})
     else:
-        click.echo(f"Error: {response.status_code} - {response.text}")
\ No newline at end of file
+        click.echo(f"Error: {response.status_code} - {response.text}")
+        return
+
+    click.echo(f"Found {len(repos)} repositories for {username}:")
+    for repo in repos:
+        click.echo(f"- {repo['name']}: {repo['html_url']}")
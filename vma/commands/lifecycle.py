@@ -0,0 +1,50 @@
+import click
+from pathlib import Path
+
+@click.command()
+@click.option("--tenant", required=True, help="Tenant name")
+def start(tenant):
+    """Start all apps for a tenant."""
+    from vma.core.plugins import get_plugin_for_path
+    from vma.utils import log, run
+    tenant_dir = Path("tenants") / tenant
+    if not tenant_dir.exists():
+        log(f"Tenant {tenant} does not exist.", level=1)
+        return
+    # One compose call covers every service instead of one invocation per app
+    compose_path = tenant_dir / "docker-compose.yml"
+    if compose_path.exists():
+        log(f"Starting all services for {tenant} with docker compose")
+        run(f"docker compose -f {compose_path.name} start", cwd=str(tenant_dir))
+        return
+    for app_path in tenant_dir.iterdir():
+        plugin = get_plugin_for_path(str(app_path))
+        if plugin:
+            log(f"Starting {app_path.name} with {plugin.__name__}")
+            plugin.start(str(app_path), {})
+        else:
+            log(f"No plugin for {app_path.name}", level=1)
+
+@click.command()
+@click.option("--tenant", required=True, help="Tenant name")
+def stop(tenant):
+    """Stop all apps for a tenant."""
+    from vma.core.plugins import get_plugin_for_path
+    from vma.utils import log, run
+    tenant_dir = Path("tenants") / tenant
+    if not tenant_dir.exists():
+        log(f"Tenant {tenant} does not exist.", level=1)
+        return
+    # One compose call covers every service instead of one invocation per app
+    compose_path = tenant_dir / "docker-compose.yml"
+    if compose_path.exists():
+        log(f"Stopping all services for {tenant} with docker compose")
+        run(f"docker compose -f {compose_path.name} stop", cwd=str(tenant_dir))
+        return
+    for app_path in tenant_dir.iterdir():
+        plugin = get_plugin_for_path(str(app_path))
+        if plugin:
+            log(f"Stopping {app_path.name} with {plugin.__name__}")
+            plugin.stop(str(app_path), {})
+        else:
+            log(f"No plugin for {app_path.name}", level=1)
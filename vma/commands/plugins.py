@@ -0,0 +1,8 @@
+import click
+
+@click.command("list-plugins")
+def list_plugins_cmd():
+    """List available plugins."""
+    from vma.core.plugins import list_plugins
+    for name in list_plugins():
+        click.echo(name)
@@ -0,0 +1,26 @@
+import click
+from pathlib import Path
+
+@click.command()
+@click.argument("tenant")
+def add_tenant(tenant):
+    from vma.utils import log
+    tenant_dir = Path("tenants") / tenant
+    if tenant_dir.exists():
+        log(f"Tenant {tenant} already exists.", level=1)
+        return
+    (tenant_dir / "apps").mkdir(parents=True)
+    (tenant_dir / "config").mkdir(parents=True)
+    log(f"Tenant {tenant} created.")
+
+@click.command()
+@click.argument("tenant")
+def remove_tenant(tenant):
+    import shutil
+    from vma.utils import log
+    tenant_dir = Path("tenants") / tenant
+    if not tenant_dir.exists():
+        log(f"Tenant {tenant} does not exist.", level=1)
+        return
+    shutil.rmtree(tenant_dir)
+    log(f"Tenant {tenant} removed.")
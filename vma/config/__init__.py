@@ -1,4 +1,8 @@
-from jinja2 import Environment, FileSystemLoader
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def get_template_env(template_dir: str):
-    return Environment(loader=FileSystemLoader(template_dir)) 
\ No newline at end of file
+    # One shared Environment per template dir so compiled templates stay cached;
+    # jinja2 is imported here so importing vma.config stays cheap
+    from jinja2 import Environment, FileSystemLoader
+    return Environment(loader=FileSystemLoader(template_dir), auto_reload=False, cache_size=-1)
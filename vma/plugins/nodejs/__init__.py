@@ -1,5 +1,5 @@
 import os
-from vma.utils import run, log
+from vma.utils import run, log, has_npm_script
 
 def detect(path: str) -> bool:
     return os.path.exists(os.path.join(path, "package.json"))
@@ -9,20 +9,22 @@ def install(path: str, config: dict):
     run("npm install", cwd=path)
 
 def build(path: str, config: dict):
-    pkg = os.path.join(path, "package.json")
-    if os.path.exists(pkg):
-        import json
-        with open(pkg) as f:
-            data = json.load(f)
-        if "build" in data.get("scripts", {}):
-            log(f"[nodejs] npm run build in {path}")
-            run("npm run build", cwd=path)
+    try:
+        has_build = has_npm_script(os.path.join(path, "package.json"), "build")
+    except FileNotFoundError:
+        return
+    if has_build:
+        log(f"[nodejs] npm run build in {path}")
+        run("npm run build", cwd=path)
 
 def start(path: str, config: dict):
-    if os.path.exists(os.path.join(path, "ecosystem.config.js")):
+    # One directory listing answers both lookups
+    with os.scandir(path) as entries:
+        names = {entry.name for entry in entries}
+    if "ecosystem.config.js" in names:
         log(f"[nodejs] pm2 start ecosystem.config.js in {path}")
         run("pm2 start ecosystem.config.js", cwd=path)
-    elif os.path.exists(os.path.join(path, "index.js")):
+    elif "index.js" in names:
         log(f"[nodejs] pm2 start index.js in {path}")
         run("pm2 start index.js", cwd=path)
     else:
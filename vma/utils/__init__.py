@@ -1,4 +1,6 @@
 import subprocess
+import shlex
+import sys
 import logging
 import os
 import shutil
@@ -7,66 +9,232 @@ from typing import Optional
 import secrets
 import string
 import json
-import yaml
+import copy
 import importlib
 import time
-import requests
-from jinja2 import Template
-import git
-import random
-
-# Generic shell execution
-
-def run(cmd: str, cwd: Optional[str] = None, env: Optional[dict] = None, _raise: bool = True):
+import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# Generic command execution
+
+# Characters that need a real shell (pipes, redirects, globs, expansions, chaining)
+_SHELL_CHARS = set("|&;<>()$`*?~\n")
+# Shell builtins that have no executable to exec
+_SHELL_BUILTINS = {".", ":", "alias", "cd", "eval", "exec", "exit", "export", "read", "set",
+                   "shift", "source", "trap", "ulimit", "umask", "unalias", "unset", "wait"}
+
+def _split_unless_shell(cmd: str):
+    # argv for a direct exec, or None when `cmd` needs a shell: shell syntax, a leading
+    # `VAR=value` assignment, a builtin, or quoting shlex can't parse
+    if any(c in _SHELL_CHARS for c in cmd):
+        return None
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, env=env, check=_raise, capture_output=True, text=True)
-        print(result.stdout)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        print(e.stdout)
+        args = shlex.split(cmd)
+    except ValueError:
+        return None
+    if args and ("=" in args[0] or args[0] in _SHELL_BUILTINS):
+        return None
+    return args
+
+def run(cmd: str, cwd: Optional[str] = None, env: Optional[dict] = None, _raise: bool = True,
+        shell: Optional[bool] = None):
+    """Run a command, streaming its combined stdout/stderr live, and return the output.
+
+    Plain commands are exec'd directly; a shell is only spawned when `cmd` uses shell
+    syntax, starts with a `VAR=value` assignment or a shell builtin such as `cd` or
+    `export`, or `shell=True` is passed.
+    """
+    args = None if shell else _split_unless_shell(cmd)
+    shell = args is None
+    if shell:
+        args = cmd
+    try:
+        proc = subprocess.Popen(args, shell=shell, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, bufsize=1)
+    except FileNotFoundError as e:
+        # Without a shell a missing binary raises instead of exiting 127
+        print(e)
         if _raise:
-            print(f"Command failed with exit code {e.returncode}:")
-            print("--- STDOUT ---")
-            print(e.stdout)
-            print("--- STDERR ---")
-            print(e.stderr)
             raise
-        return e.stdout
+        return ""
+    output = []
+    with proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            output.append(line)
+    stdout = "".join(output)
+    if proc.returncode and _raise:
+        print(f"Command failed with exit code {proc.returncode}: {cmd}")
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout)
+    return stdout
+
+def fetch_container_logs(containers, tail: int = 20):
+    """Fetch the last `tail` log lines of each container concurrently, in input order."""
+    def fetch(container):
+        try:
+            result = subprocess.run(["docker", "logs", "--tail", str(tail), container],
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        except OSError as e:
+            # e.g. docker not on PATH; report it like run(..., _raise=False) instead of dying
+            return str(e)
+        return result.stdout
+
+    with ThreadPoolExecutor(max_workers=len(containers)) as pool:
+        return list(pool.map(fetch, containers))
+
+# CLI logger, configured once at import; without a handler INFO records were dropped
+# by the root logger's last-resort handler after going through the lookup anyway
+_LOG = logging.getLogger("vma")
+_LOG.addHandler(logging.StreamHandler())
+_LOG.setLevel(logging.INFO)
+_LOG.propagate = False
 
 def log(message: str, level: int = 0):
-    logging.log(logging.INFO if level == 0 else logging.WARNING, message)
+    if level == 0:
+        _LOG.info(message)
+    else:
+        _LOG.warning(message)
+
+# Jinja2 templating (single definition lives in vma.config)
+from vma.config import get_template_env
+
+# PyYAML, requests and jinja2 are imported on first use rather than at module import,
+# so commands that never touch them (logs, start, stop, ...) don't pay their import cost
+
+@lru_cache(maxsize=None)
+def _yaml():
+    # libyaml-backed C loader/dumper when PyYAML was built with it; same safe semantics
+    import yaml
+    try:
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:
+        return yaml, yaml.SafeLoader, yaml.SafeDumper
 
-# Jinja2 templating
-from jinja2 import Environment, FileSystemLoader
+def _yaml_load(stream):
+    yaml, loader, _ = _yaml()
+    return yaml.load(stream, Loader=loader)
 
-def get_template_env(template_dir: str):
-    return Environment(loader=FileSystemLoader(template_dir))
+def _yaml_dump(data, stream, **kwargs):
+    yaml, _, dumper = _yaml()
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
 
 # Config file helpers
 
+def _write_if_changed(path: str, payload: str) -> bool:
+    # Leave byte-identical files alone so their mtime (and anything keyed on it, like
+    # our caches or compose's config hash) stays put; otherwise swap in atomically
+    data = payload.encode()
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+        exists = True
+    except FileNotFoundError:
+        exists = False
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        # The temp file is a new inode; keep the existing file's mode (e.g. a chmod 600 .env)
+        if exists:
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
 def read_json(path: str):
     with open(path, 'r') as f:
         return json.load(f)
 
 def write_json(path: str, data):
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
-
-def read_yaml(path: str):
+    _write_if_changed(path, json.dumps(data, indent=2))
+
+# Parsed YAML keyed by absolute path -> (mtime_ns, data); callers get deep copies
+# so mutating a returned config never corrupts the cache
+_YAML_CACHE = {}
+
+def _yaml_sidecar_enabled():
+    return os.environ.get("VMA_YAML_CACHE") == "1"
+
+def _write_yaml_sidecar(path, data):
+    # JSON copy of a YAML file; JSON loads roughly an order of magnitude faster
+    tmp_path = f"{path}.cache.json.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, f"{path}.cache.json")
+
+def _load_yaml_file(path, mtime):
+    # Opt-in (VMA_YAML_CACHE=1) cross-process cache: trust the sidecar only while it is
+    # at least as new as the YAML, so hand edits to the YAML are always picked up
+    if _yaml_sidecar_enabled():
+        sidecar = f"{path}.cache.json"
+        try:
+            if os.stat(sidecar).st_mtime_ns >= mtime:
+                with open(sidecar, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
     with open(path, 'r') as f:
-        return yaml.safe_load(f)
+        data = _yaml_load(f)
+    if _yaml_sidecar_enabled():
+        _write_yaml_sidecar(path, data)
+    return data
 
-def write_yaml(path: str, data):
-    with open(path, 'w') as f:
-        yaml.safe_dump(data, f)
+def read_yaml(path: str):
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _load_yaml_file(path, mtime))
+        _YAML_CACHE[path] = cached
+    return copy.deepcopy(cached[1])
+
+def write_yaml(path: str, data, sort_keys: bool = True):
+    path = os.path.abspath(path)
+    _write_if_changed(path, _yaml_dump(data, None, sort_keys=sort_keys))
+    _YAML_CACHE[path] = (os.stat(path).st_mtime_ns, copy.deepcopy(data))
+    if _yaml_sidecar_enabled():
+        _write_yaml_sidecar(path, data)
+
+@lru_cache(maxsize=128)
+def _read_package_json(path: str, mtime_ns: int):
+    return json.loads(Path(path).read_bytes())
+
+def read_package_json(path: str):
+    """Parsed package.json, re-read only when the file's mtime changes. Treat as read-only."""
+    return _read_package_json(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+def has_npm_script(path: str, name: str) -> bool:
+    return name in read_package_json(path).get("scripts", {})
 
 # Plugin loader utility
 
 def load_plugin(name: str):
     return importlib.import_module(f"bench.plugins.{name}")
 
+_RANDOM_ALPHABET = string.ascii_lowercase + string.digits
+# Largest multiple of the alphabet size that fits in a byte; higher bytes are rejected
+# so every character stays equally likely
+_RANDOM_BYTE_LIMIT = 256 - 256 % len(_RANDOM_ALPHABET)
+
 def random_string(length=12):
-    return ''.join(secrets.choice(string.ascii_lowercase + string.digits) for _ in range(length))
+    # One urandom read per batch instead of one secrets.choice() call per character
+    chars = []
+    while len(chars) < length:
+        chars.extend(_RANDOM_ALPHABET[b % len(_RANDOM_ALPHABET)]
+                     for b in secrets.token_bytes(length) if b < _RANDOM_BYTE_LIMIT)
+    return ''.join(chars[:length])
+
+def _tenant_port(tenant, base, span=1000):
+    # Stable across interpreter runs, unlike hash() which is salted per process
+    digest = hashlib.blake2b(tenant.encode(), digest_size=4).digest()
+    return base + int.from_bytes(digest, "big") % span
 
 def generate_tenant_config(tenant):
     tenant_config_path = Path(f"tenants/{tenant}/config/tenant_config.yaml")
@@ -95,9 +263,9 @@ def generate_tenant_config(tenant):
         print(f"Using existing database password for tenant {tenant}")
 
     # Use existing ports if available, otherwise generate
-    backend_port = config.get("backend_port", 5000 + abs(hash(tenant)) % 1000)
+    backend_port = config.get("backend_port", _tenant_port(tenant, 5000))
     frontend_port = config.get("frontend_port", backend_port + 1000)
-    nginx_port = config.get("nginx_port", 8000 + abs(hash(tenant)) % 1000)
+    nginx_port = config.get("nginx_port", _tenant_port(tenant, 8000))
     redis_pass = config.get("redis_pass", random_string(16))
     # Use tenant-specific container names in URLs
     redis_url = config.get("redis_url", f"redis://:{redis_pass}@{tenant}_redis:6379")
@@ -127,36 +295,45 @@ def generate_tenant_config(tenant):
 
 def write_env_file(path, env_dict):
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        for k, v in env_dict.items():
-            f.write(f"{k}={v}\n")
+    _write_if_changed(path, "".join(f"{k}={v}\n" for k, v in env_dict.items()))
 
 def wait_for_service(url, timeout=60):
+    import requests
     print(f"Waiting for {url} ...")
-    for i in range(timeout):
-        try:
-            r = requests.get(url, timeout=5)
-            if r.status_code == 200:
-                print(f"Service at {url} is up!")
-                return True
-            else:
-                print(f"Attempt {i+1}/{timeout}: Service returned status code {r.status_code}")
-        except requests.exceptions.ConnectionError:
-            print(f"Attempt {i+1}/{timeout}: Connection refused")
-        except Exception as e:
-            print(f"Attempt {i+1}/{timeout}: {str(e)[:100]}")
-        time.sleep(1)
+    # One pooled connection for the whole wait; retries are handled by the loop below
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    attempt = 0
+    with session:
+        while True:
+            attempt += 1
+            try:
+                r = session.get(url, timeout=2)
+                if r.status_code == 200:
+                    print(f"Service at {url} is up!")
+                    return True
+                else:
+                    print(f"Attempt {attempt}: Service returned status code {r.status_code}")
+            except requests.exceptions.ConnectionError:
+                print(f"Attempt {attempt}: Connection refused")
+            except Exception as e:
+                print(f"Attempt {attempt}: {str(e)[:100]}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Exponential backoff so fast services are detected quickly, capped at 1s
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.6, 1.0)
     print(f"Service at {url} did not become healthy in {timeout} seconds.")
     return False
 
-# This function is no longer used since we create the nginx config in add_frontend_to_compose_file
-def generate_nginx_config_advanced(tenant, config, nginx_path):
-    # Check if nginx_path is a directory and remove it
-    if os.path.isdir(nginx_path):
-        shutil.rmtree(nginx_path)
-        print(f"Removed directory at {nginx_path}")
-    
-    nginx_template = """
+# Nginx config templates, defined once at import rather than rebuilt per call
+
+_NGINX_TEMPLATE = """
 server {
     listen 80;
     server_name {{ tenant }}.vsync localhost;
@@ -175,7 +352,48 @@ server {
     }
 }
 """
-    rendered = Template(nginx_template).render(
+
+# str.format template for the tenant proxy config; literal braces are doubled
+_NGINX_CONF_FMT = """
+server {{
+    listen 80;
+    server_name {tenant}.vsync localhost;
+
+    location /v1/api {{
+        proxy_pass http://{tenant}_backend:5004;
+        proxy_set_header Host $host;
+        proxy_set_header X-Real-IP $remote_addr;
+        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_set_header X-Forwarded-Proto $scheme;
+        proxy_read_timeout 300s;
+        proxy_connect_timeout 75s;
+    }}
+
+    location / {{
+        proxy_pass http://{tenant}_frontend:3001/;
+        proxy_set_header Host $host;
+        proxy_set_header X-Real-IP $remote_addr;
+        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_set_header X-Forwarded-Proto $scheme;
+        proxy_read_timeout 300s;
+        proxy_connect_timeout 75s;
+    }}
+}}
+"""
+
+@lru_cache(maxsize=None)
+def _nginx_template():
+    # Compiled on first use and reused, instead of re-parsing the source on every render
+    return get_template_env(os.path.dirname(__file__)).from_string(_NGINX_TEMPLATE)
+
+# This function is no longer used since we create the nginx config in add_frontend_to_compose_file
+def generate_nginx_config_advanced(tenant, config, nginx_path):
+    # Check if nginx_path is a directory and remove it
+    if os.path.isdir(nginx_path):
+        shutil.rmtree(nginx_path)
+        print(f"Removed directory at {nginx_path}")
+    
+    rendered = _nginx_template().render(
         tenant=tenant,
         backend_port=config['backend_port'],
         frontend_port=config['frontend_port']
@@ -196,45 +414,65 @@ server {
     print(f"Nginx config written to {nginx_path}")
     return nginx_path
 
+@lru_cache(maxsize=32)
+def _hosts_lookup(hosts_path, needle, mtime_ns):
+    # Returns (needle found, last line lacks a trailing newline); stops at the first
+    # matching line and is memoized per mtime so repeat calls skip the file entirely
+    last = ""
+    with open(hosts_path, "r") as f:
+        for line in f:
+            if needle in line:
+                return True, False
+            last = line
+    return False, bool(last) and not last.endswith("\n")
+
 def add_tenant_to_hosts(tenant: str, password: Optional[str] = None, config=None):
     # Use localhost explicitly instead of 127.0.0.1 for better compatibility
     hosts_line = f"127.0.0.1 {tenant}.vsync\n"
     hosts_path = "/etc/hosts"
     try:
-        # Check if already present
-        with open(hosts_path, "r") as f:
-            if f"{tenant}.vsync" in f.read():
-                print(f"/etc/hosts already contains {tenant}.vsync")
-                # Try to ping the domain to verify it's working
-                try:
-                    subprocess.run(f"ping -c 1 {tenant}.vsync", shell=True, capture_output=True, text=True)
+        # Only touch the file when the entry is missing, so re-deploys skip the
+        # write (and any sudo prompt) entirely
+        found, needs_newline = _hosts_lookup(hosts_path, f"{tenant}.vsync", os.stat(hosts_path).st_mtime_ns)
+        if found:
+            print(f"/etc/hosts already contains {tenant}.vsync")
+            # Resolving the name costs a fork and an ICMP round-trip, so it is opt-in
+            if os.environ.get("VMA_VERIFY_HOSTS"):
+                result = subprocess.run(["ping", "-c", "1", f"{tenant}.vsync"], capture_output=True, text=True)
+                if result.returncode == 0:
                     print(f"Successfully pinged {tenant}.vsync")
-                except:
+                else:
                     print(f"Warning: Could not ping {tenant}.vsync")
-            else:
-                # Try direct write
-                try:
-                    with open(hosts_path, "a") as f:
-                        f.write(hosts_line)
-                    print(f"Added {tenant}.vsync to /etc/hosts")
-                except PermissionError:
-                    # Use sudo tee if not writable
-                    print(f"/etc/hosts not writable, trying with sudo...")
-                    if password is None:
-                        password = os.environ.get("HOSTS_SUDO_PASS", "gautam")
-                    cmd = f'echo "{password}" | sudo -S sh -c "echo \'{hosts_line.strip()}\' >> {hosts_path}"'
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        print(f"Added {tenant}.vsync to /etc/hosts (with sudo)")
-                    else:
-                        print(f"Failed to add {tenant}.vsync to /etc/hosts: {result.stderr}")
+        else:
+            # Don't glue the entry onto a last line that lacks a trailing newline
+            if needs_newline:
+                hosts_line = "\n" + hosts_line
+            # Try direct write
+            try:
+                with open(hosts_path, "a") as f:
+                    f.write(hosts_line)
+                print(f"Added {tenant}.vsync to /etc/hosts")
+            except PermissionError:
+                # Append with a single sudo call; the password goes in on stdin rather
+                # than through an `echo` in an outer shell
+                print(f"/etc/hosts not writable, trying with sudo...")
+                if password is None:
+                    password = os.environ.get("HOSTS_SUDO_PASS", "gautam")
+                result = subprocess.run(
+                    ["sudo", "-S", "-p", "", "sh", "-c", f"echo '{hosts_line.rstrip()}' >> {hosts_path}"],
+                    input=f"{password}\n", capture_output=True, text=True
+                )
+                if result.returncode == 0:
+                    print(f"Added {tenant}.vsync to /etc/hosts (with sudo)")
+                else:
+                    print(f"Failed to add {tenant}.vsync to /etc/hosts: {result.stderr}")
     except Exception as e:
         print(f"Error updating /etc/hosts: {e}")
     
     # Print access instructions with direct URLs
     if config:
-        nginx_port = config.get("nginx_port", 8000 + abs(hash(tenant)) % 1000)
-        backend_port = config.get("backend_port", 5000 + abs(hash(tenant)) % 1000)
+        nginx_port = config.get("nginx_port") or _tenant_port(tenant, 8000)
+        backend_port = config.get("backend_port") or _tenant_port(tenant, 5000)
         print(f"\nAccess options:")
         print(f"1. Via domain: http://{tenant}.vsync:{nginx_port}/")
         print(f"2. Via localhost: http://localhost:{nginx_port}/")
@@ -244,6 +482,17 @@ def add_tenant_to_hosts(tenant: str, password: Optional[str] = None, config=None
         # Also print the exact URL to use for frontend .env BASE_URL
         print(f"\nFrontend API URL (for .env): http://{tenant}.vsync:{nginx_port}/v1/api")
 
+def git_clone(repo_url, branch, dest_path):
+    """Shallow, blob-filtered clone of a single branch; deploys only need the branch tip.
+
+    git writes its progress and any error straight to the terminal.
+    """
+    subprocess.run(
+        ["git", "clone", "--depth", "1", "--single-branch", "--branch", branch,
+         "--filter=blob:none", repo_url, str(dest_path)],
+        check=True
+    )
+
 def clone_project_repo(repo_url, branch, dest_path):
     """Clone a Git repository to the specified destination path."""
     tenant_dir = dest_path.parent
@@ -263,22 +512,37 @@ def clone_project_repo(repo_url, branch, dest_path):
                 target_path.rmdir()
         
         # Clone directly into the target folder name
-        git.Repo.clone_from(repo_url, str(target_path), branch=branch)
-    except git.GitCommandError as e:
-        print(f"Git clone failed: {e.stderr}")
+        git_clone(repo_url, branch, target_path)
+    except subprocess.CalledProcessError as e:
+        print(f"Git clone failed with exit code {e.returncode}")
         raise
 
     # If .gitmodules exists in the cloned repo, update submodules
     if (target_path / ".gitmodules").exists():
         print("Initializing git submodules ...")
-        run("git submodule update --init --recursive", cwd=str(target_path))
+        run("git submodule update --init --recursive --depth=1", cwd=str(target_path))
         print("Submodules initialized.")
 
     return target_path
 
+def _node_http_check(url):
+    # Healthcheck for app images built from the user's repo: those always have node (they
+    # run npm), but slim/alpine Node bases don't ship curl. Any non-5xx answer counts, since
+    # the app's root may well reply 401/404; the point is that the server is listening
+    return ["CMD", "node", "-e",
+            f"require('http').get('{url}', r => process.exit(r.statusCode < 500 ? 0 : 1))"
+            ".on('error', () => process.exit(1))"]
+
 def generate_base_compose_file(tenant, config, backend_project_path):
     # Generate compose file with infra (DB, Redis) and backend service
     backend_dir = backend_project_path # This is the path to the backend folder inside the tenant dir
+
+    # Postgres runs /docker-entrypoint-initdb.d scripts on first boot, so the transactional
+    # database exists before the DB healthcheck passes and no `docker exec psql` is needed
+    init_sql_path = backend_project_path.parent / "init.sql"
+    _write_if_changed(str(init_sql_path),
+                      f"CREATE DATABASE {config['db_transactional_name']} OWNER {config['db_user']};\n")
+
     compose = {
         "version": "3.8",
         "services": {
@@ -290,7 +554,10 @@ def generate_base_compose_file(tenant, config, backend_project_path):
                     "POSTGRES_USER": config["db_user"],
                     "POSTGRES_PASSWORD": config["db_pass"]
                 },
-                "volumes": [f"{tenant}_db_data:/var/lib/postgresql/data"],
+                "volumes": [
+                    f"{tenant}_db_data:/var/lib/postgresql/data",
+                    "./init.sql:/docker-entrypoint-initdb.d/10-init.sql:ro"
+                ],
                 "networks": [tenant],
                 "healthcheck": { # Add healthcheck for PostgreSQL
                     "test": ["CMD-SHELL", "bash -c 'PGUSER=$POSTGRES_USER pg_isready'"],
@@ -307,7 +574,13 @@ def generate_base_compose_file(tenant, config, backend_project_path):
                     "REDIS_PASSWORD": config["redis_pass"]
                 },
                 "volumes": [f"{tenant}_redis_data:/var/lib/redis/data"],
-                "networks": [tenant]
+                "networks": [tenant],
+                "healthcheck": { # Lets `docker compose up --wait` gate on Redis readiness
+                    "test": ["CMD", "redis-cli", "ping"],
+                    "interval": "2s",
+                    "timeout": "3s",
+                    "retries": 15
+                }
             },
             f"{tenant}_backend": {
                 "build": str(backend_dir.relative_to(backend_dir.parent)), # Build context is relative to the directory containing the compose file (tenant dir)
@@ -325,6 +598,13 @@ def generate_base_compose_file(tenant, config, backend_project_path):
                 "networks": [tenant],
                 "extra_hosts": [f"{tenant}.vsync:127.0.0.1"],
                 "command": f"sh -c 'sleep 15 && npm run deploy'", # Add delay to ensure DB is ready
+                "healthcheck": { # Lets `docker compose up --wait` gate on the API answering
+                    "test": _node_http_check("http://localhost:5004/v1/api"),
+                    "interval": "2s",
+                    "timeout": "5s",
+                    "retries": 60,
+                    "start_period": "60s" # The command sleeps 15s before `npm run deploy` starts
+                },
                 "environment": {
                     "NODE_ENV": "development",
                     "DB_SERVER": f"{tenant}_db"
@@ -344,8 +624,8 @@ def generate_base_compose_file(tenant, config, backend_project_path):
     }
     # Compose file is placed in the tenant directory
     compose_path = backend_project_path.parent / "docker-compose.yml"
-    with open(compose_path, "w") as f:
-        yaml.safe_dump(compose, f, sort_keys=False)
+    # write_yaml also seeds the in-memory (and sidecar) cache, so later reads skip the parse
+    write_yaml(str(compose_path), compose, sort_keys=False)
     print(f"docker-compose.yml written to {compose_path}")
     return compose_path
 
@@ -369,11 +649,18 @@ def add_frontend_to_compose_file(tenant, config, frontend_project_path, compose_
         "command": "npm start",
         "environment": {
             "PORT": "3001"
+        },
+        "healthcheck": { # Dev server compiles before it answers, hence the long start_period
+            "test": _node_http_check("http://localhost:3001/"),
+            "interval": "2s",
+            "timeout": "5s",
+            "retries": 30,
+            "start_period": "120s"
         }
     }
 
     # Add Nginx service with dynamic port based on tenant
-    nginx_port = config.get("nginx_port", 8000 + abs(hash(tenant)) % 1000)
+    nginx_port = config.get("nginx_port") or _tenant_port(tenant, 8000)
     
     # Check if nginx.conf is a directory and remove it if it is
     nginx_conf_path = f"tenants/{tenant}/nginx.conf"
@@ -386,32 +673,7 @@ def add_frontend_to_compose_file(tenant, config, frontend_project_path, compose_
     
     # Create the nginx config file with port 3001 for frontend
     with open(nginx_conf_path, "w") as f:
-        f.write(f"""
-server {{
-    listen 80;
-    server_name {tenant}.vsync localhost;
-
-    location /v1/api {{
-        proxy_pass http://{tenant}_backend:5004;
-        proxy_set_header Host $host;
-        proxy_set_header X-Real-IP $remote_addr;
-        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
-        proxy_set_header X-Forwarded-Proto $scheme;
-        proxy_read_timeout 300s;
-        proxy_connect_timeout 75s;
-    }}
-
-    location / {{
-        proxy_pass http://{tenant}_frontend:3001/;
-        proxy_set_header Host $host;
-        proxy_set_header X-Real-IP $remote_addr;
-        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
-        proxy_set_header X-Forwarded-Proto $scheme;
-        proxy_read_timeout 300s;
-        proxy_connect_timeout 75s;
-    }}
-}}
-""")
+        f.write(_NGINX_CONF_FMT.format(tenant=tenant))
     print(f"Created nginx config at {nginx_conf_path}")
     
     # Use absolute path for volume mount
@@ -427,7 +689,14 @@ server {{
         "depends_on": [f"{tenant}_backend", f"{tenant}_frontend"],
         "networks": [tenant],
         "extra_hosts": [f"{tenant}.vsync:127.0.0.1"],
-        "restart": "on-failure"
+        "restart": "on-failure",
+        "healthcheck": { # Proxies to the frontend, so healthy means the whole chain answers
+            "test": ["CMD", "curl", "-f", "http://localhost/"],
+            "interval": "2s",
+            "timeout": "5s",
+            "retries": 30,
+            "start_period": "120s"
+        }
     }
 
     # Ensure the network is defined if it wasn't already (should be there from backend deploy)
@@ -467,10 +736,7 @@ def setup_and_start_backend(tenant, vsync_project_path, backend_path):
     pkg = os.path.join(backend_dir, "package.json")
     if os.path.exists(pkg):
         try:
-            import json
-            with open(pkg) as f:
-                data = json.load(f)
-            if "build" in data.get("scripts", {}):
+            if has_npm_script(pkg, "build"):
                 print(f"[nodejs] Running build script in {backend_dir}")
                 run("npm run build", cwd=str(backend_dir))
         except Exception as e:
@@ -501,10 +767,7 @@ def setup_and_start_frontend(tenant, vsync_project_path, frontend_path):
     pkg = os.path.join(frontend_dir, "package.json")
     if os.path.exists(pkg):
         try:
-            import json
-            with open(pkg) as f:
-                data = json.load(f)
-            if "build" in data.get("scripts", {}):
+            if has_npm_script(pkg, "build"):
                 print(f"[nodejs/react] Running build script in {frontend_dir}")
                 run("npm run build", cwd=str(frontend_dir))
         except Exception as e:
@@ -553,7 +816,6 @@ def setup_tenant_envs(tenant, config):
 
 def generate_docker_compose(tenant, config):
     # This function also seems to be part of the old hardcoded setup. Keep or remove.
-    import yaml
     compose = {
         "version": "3.8",
         "services": {
@@ -611,7 +873,7 @@ def generate_docker_compose(tenant, config):
     }
     os.makedirs(f"tenants/{tenant}", exist_ok=True)
     with open(f"tenants/{tenant}/docker-compose.yml", "w") as f:
-        yaml.safe_dump(compose, f, sort_keys=False)
+        _yaml_dump(compose, f, sort_keys=False)
 
 def generate_nginx_conf(tenant, tenant_port):
     nginx_conf_path = f"tenants/{tenant}/nginx.conf"
@@ -638,8 +900,7 @@ server {{
 # Renamed to avoid recursive call issues
 def clone_repo(repo_url: str, branch: str, dest_path: Path):
     """Clone a Git repository."""
-    from git import Repo
-    log(f"Cloning repository {repo_url} into {dest_path}", level=0)
+    _LOG.info("Cloning repository %s into %s", repo_url, dest_path)
     
     # Make sure parent directory exists
     dest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -647,53 +908,14 @@ def clone_repo(repo_url: str, branch: str, dest_path: Path):
     # If destination exists but is not empty, remove it first
     if dest_path.exists():
         if any(dest_path.iterdir()):
-            log(f"Destination {dest_path} exists and is not empty. Removing it first.", level=1)
+            _LOG.warning("Destination %s exists and is not empty. Removing it first.", dest_path)
             shutil.rmtree(dest_path)
         else:
             dest_path.rmdir()
             
-    Repo.clone_from(repo_url, dest_path, branch=branch)
+    git_clone(repo_url, branch, dest_path)
     return dest_path
 
-def setup_and_start_backend(tenant: str, app_path: Path):
-    """Setup and start backend container for a tenant."""
-    compose_file = Path("tenants") / tenant / "docker-compose.yml"
-    log(f"Setting up backend for tenant {tenant}", level=0)
-    # Generate Docker Compose file
-    compose_content = f"""
-    version: '3.8'
-    services:
-      backend:
-        build: {app_path}
-        ports:
-          - "{random.randint(3000, 4000)}:3000"
-        environment:
-          - NODE_ENV=production
-    """
-    write_yaml(compose_file, yaml.safe_load(compose_content))
-    # Start container
-    run(f"docker-compose -f {compose_file} up -d")
-
-def generate_nginx_config_advanced(tenant: str):
-    """Generate Nginx configuration for a tenant."""
-    nginx_file = Path("tenants") / tenant / "nginx.conf"
-    log(f"Generating Nginx configuration for tenant {tenant}", level=0)
-    nginx_content = f"""
-    server {{
-        listen 80;
-        server_name {tenant}.example.com;
-
-        location / {{
-            proxy_pass http://localhost:{random.randint(3000, 4000)};
-            proxy_set_header Host $host;
-            proxy_set_header X-Real-IP $remote_addr;
-            proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
-        }}
-    }}
-    """
-    nginx_file.write_text(nginx_content)
-    run(f"docker exec nginx-container nginx -s reload")
-
 # Remove the monolithic setup_tenant_structure_agnostic
 # def setup_tenant_structure_agnostic(tenant, vsync_project_path, backend_path, frontend_path):
 #     ...